@@ -71,6 +71,15 @@ export class ExtensionConfig {
     HOST_PERMISSIONS: ['*://*.jotform.com/*'],
   } as const;
 
+  // Origins the content script runs on, shared with the manifest so
+  // web accessible resources stay in sync
+  static readonly CONTENT_SCRIPT_MATCHES = [
+    '*://*.jotform.com/*',
+    '*://*.sahibinden.com/*',
+    '*://*.arabam.com/*',
+    '*://*.chess.com/*',
+  ] as const;
+
   // Content Security Policy settings
   static readonly CSP = {
     SCRIPT_SRC: "'self' 'unsafe-inline'",
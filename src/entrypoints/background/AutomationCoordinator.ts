@@ -85,7 +85,7 @@ export class AutomationCoordinator {
         const remainingSequence: AutomationSequence = {
           id: currentSequence.id + '_continued',
           name: currentSequence.name + ' (Continued)',
-          actions: pendingActions,
+          actions: [...pendingActions],
         };
 
         await this.sendToContentScript(tabId, {
@@ -130,7 +130,7 @@ export class AutomationCoordinator {
   /**
    * Get current automation state
    */
-  getAutomationState(): AutomationState {
+  getAutomationState(): Readonly<AutomationState> {
     return this.stateManager.getState();
   }
 
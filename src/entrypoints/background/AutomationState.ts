@@ -10,7 +10,7 @@ export interface AutomationState {
   isActive: boolean;
   currentSequence?: AutomationSequence;
   currentStepIndex: number;
-  pendingActions: AutomationAction[];
+  pendingActions: readonly AutomationAction[];
   targetTabId?: number;
   lastUrl?: string;
 }
@@ -20,6 +20,7 @@ export interface AutomationState {
  */
 export class AutomationStateManager {
   private automationState: AutomationState;
+  private stateSnapshot: Readonly<AutomationState> | null = null;
 
   constructor() {
     this.automationState = {
@@ -37,9 +38,10 @@ export class AutomationStateManager {
       isActive: true,
       currentSequence: sequence,
       currentStepIndex: 0,
-      pendingActions: [...sequence.actions],
+      pendingActions: sequence.actions,
       targetTabId: tabId,
     };
+    this.stateSnapshot = null;
   }
 
   /**
@@ -52,6 +54,7 @@ export class AutomationStateManager {
         this.automationState.currentSequence.actions.slice(
           completedStepIndex + 1
         );
+      this.stateSnapshot = null;
     }
   }
 
@@ -60,13 +63,18 @@ export class AutomationStateManager {
    */
   updateLastUrl(url: string): void {
     this.automationState.lastUrl = url;
+    this.stateSnapshot = null;
   }
 
   /**
    * Get current automation state
+   * Returns a frozen snapshot that is rebuilt only after the state changes
    */
-  getState(): AutomationState {
-    return { ...this.automationState };
+  getState(): Readonly<AutomationState> {
+    if (!this.stateSnapshot) {
+      this.stateSnapshot = Object.freeze({ ...this.automationState });
+    }
+    return this.stateSnapshot;
   }
 
   /**
@@ -78,6 +86,7 @@ export class AutomationStateManager {
       currentStepIndex: 0,
       pendingActions: [],
     };
+    this.stateSnapshot = null;
   }
 
   /**
@@ -97,7 +106,7 @@ export class AutomationStateManager {
   /**
    * Get pending actions
    */
-  getPendingActions(): AutomationAction[] {
+  getPendingActions(): readonly AutomationAction[] {
     return this.automationState.pendingActions;
   }
 
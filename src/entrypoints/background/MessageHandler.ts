@@ -2,6 +2,7 @@ import { ServiceFactory } from '@/services/DIContainer';
 import { LoggingService } from '@/services/LoggingService';
 import {
   AutomationMessage,
+  AutomationMessageType,
   ExecuteSequenceMessage,
   AutomationStateResponseMessage,
   NavigationDetectedMessage,
@@ -16,10 +17,17 @@ import {
   StopAutomationMessage,
 } from '@/services/AutomationEngine/MessageTypes';
 import { AutomationCoordinator } from './AutomationCoordinator.js';
+import { AutomationState } from './AutomationState';
 import { browser } from 'wxt/browser';
 import { ErrorHandlingConfig } from '../../utils/ErrorHandlingUtils';
 import { ExtensionUtils } from '../../utils/ExtensionUtils';
 
+type MessageRoute = (
+  message: AutomationMessage,
+  sender: chrome.runtime.MessageSender,
+  sendResponse: (response?: AutomationMessage) => void
+) => void | Promise<void>;
+
 /**
  * Message handler for processing all background script messages
  */
@@ -27,24 +35,131 @@ export class MessageHandler {
   private readonly serviceFactory: ServiceFactory;
   private readonly logger: LoggingService;
   private readonly coordinator: AutomationCoordinator;
+  private readonly routes: Map<AutomationMessageType, MessageRoute>;
+  private stateResponseCache: {
+    state: Readonly<AutomationState>;
+    response: AutomationStateResponseMessage;
+  } | null = null;
 
   constructor(coordinator: AutomationCoordinator) {
     this.serviceFactory = ServiceFactory.getInstance();
     this.logger = this.serviceFactory.createLoggingService();
     this.coordinator = coordinator;
+    this.routes = this.createRoutes();
+  }
+
+  /**
+   * Build the message type dispatch table once per handler
+   */
+  private createRoutes(): Map<AutomationMessageType, MessageRoute> {
+    return new Map<AutomationMessageType, MessageRoute>([
+      [
+        'EXECUTE_SEQUENCE',
+        (message, sender, sendResponse) =>
+          this.handleExecuteSequence(
+            message as ExecuteSequenceMessage,
+            sender,
+            sendResponse
+          ),
+      ],
+      [
+        'CONTENT_SCRIPT_READY',
+        (message, sender) =>
+          this.handleContentScriptReady(
+            message as ContentScriptReadyMessage,
+            sender
+          ),
+      ],
+      [
+        'AUTOMATION_STATE_REQUEST',
+        (_message, _sender, sendResponse) =>
+          this.handleAutomationStateRequest(sendResponse),
+      ],
+      [
+        'SEQUENCE_COMPLETE',
+        (message) =>
+          this.handleSequenceComplete(message as SequenceCompleteMessage),
+      ],
+      [
+        'SEQUENCE_ERROR',
+        (message) => this.handleSequenceError(message as SequenceErrorMessage),
+      ],
+      [
+        'NAVIGATION_DETECTED',
+        (message, sender) =>
+          this.handleNavigationDetected(
+            message as NavigationDetectedMessage,
+            sender
+          ),
+      ],
+      [
+        'STEP_PROGRESS_UPDATE',
+        (message) =>
+          this.handleStepProgressUpdate(message as StepProgressUpdateMessage),
+      ],
+      [
+        'LIST_INTERACTIVE_ELEMENTS',
+        (message, sender) =>
+          this.handleListInteractiveElements(message, sender),
+      ],
+      [
+        'INIT_SESSION',
+        (message, _sender, sendResponse) =>
+          this.handleInitSession(message as InitSessionMessage, sendResponse),
+      ],
+      [
+        'START_AUTOMATION',
+        (message, _sender, sendResponse) =>
+          this.handleStartAutomation(
+            message as StartAutomationMessage,
+            sendResponse
+          ),
+      ],
+      [
+        'STOP_AUTOMATION',
+        (message, _sender, sendResponse) =>
+          this.handleStopAutomation(
+            message as StopAutomationMessage,
+            sendResponse
+          ),
+      ],
+    ]);
   }
 
   /**
    * Handle incoming messages from popup and content scripts
+   * Returns whether the message was routed, so unrouted traffic can be
+   * left to other listeners
    */
-  async handleMessage(
+  handleMessage(
+    message: AutomationMessage,
+    sender: chrome.runtime.MessageSender,
+    sendResponse: (response?: AutomationMessage) => void
+  ): boolean {
+    // Cheap rejection for messages this handler does not route, such as
+    // typed messaging traffic or malformed payloads, before any logging
+    const route = this.routes.get(message?.type);
+    if (!route) {
+      return false;
+    }
+
+    void this.dispatchMessage(route, message, sender, sendResponse);
+    return true;
+  }
+
+  /**
+   * Run a matched route with logging and error handling
+   */
+  private async dispatchMessage(
+    route: MessageRoute,
     message: AutomationMessage,
     sender: chrome.runtime.MessageSender,
     sendResponse: (response?: AutomationMessage) => void
   ): Promise<void> {
     try {
       this.logger.info(
-        `Background received message: ${message.type} from ${sender.tab ? 'content script' : 'extension'}`,
+        () =>
+          `Background received message: ${message.type} from ${sender.tab ? 'content script' : 'extension'}`,
         'MessageHandler'
       );
       this.logger.debug(`Message details:`, 'MessageHandler', {
@@ -52,70 +167,7 @@ export class MessageHandler {
         sender,
       });
 
-      switch (message.type) {
-        case 'EXECUTE_SEQUENCE':
-          await this.handleExecuteSequence(
-            message as ExecuteSequenceMessage,
-            sender,
-            sendResponse
-          );
-          break;
-
-        case 'CONTENT_SCRIPT_READY':
-          await this.handleContentScriptReady(
-            message as ContentScriptReadyMessage,
-            sender
-          );
-          break;
-
-        case 'AUTOMATION_STATE_REQUEST':
-          this.handleAutomationStateRequest(sendResponse);
-          break;
-
-        case 'SEQUENCE_COMPLETE':
-          this.handleSequenceComplete(message as SequenceCompleteMessage);
-          break;
-
-        case 'SEQUENCE_ERROR':
-          this.handleSequenceError(message as SequenceErrorMessage);
-          break;
-
-        case 'NAVIGATION_DETECTED':
-          await this.handleNavigationDetected(
-            message as NavigationDetectedMessage,
-            sender
-          );
-          break;
-
-        case 'STEP_PROGRESS_UPDATE':
-          this.handleStepProgressUpdate(message as StepProgressUpdateMessage);
-          break;
-
-        case 'LIST_INTERACTIVE_ELEMENTS':
-          await this.handleListInteractiveElements(message, sender);
-          break;
-
-        case 'INIT_SESSION':
-          await this.handleInitSession(
-            message as InitSessionMessage,
-            sendResponse
-          );
-          break;
-
-        case 'START_AUTOMATION':
-          await this.handleStartAutomation(
-            message as StartAutomationMessage,
-            sendResponse
-          );
-          break;
-
-        case 'STOP_AUTOMATION':
-          await this.handleStopAutomation(
-            message as StopAutomationMessage,
-            sendResponse
-          );
-          break;
-      }
+      await route(message, sender, sendResponse);
     } catch (error) {
       const config: ErrorHandlingConfig = {
         context: 'MessageHandler.handleMessage',
@@ -202,16 +254,25 @@ export class MessageHandler {
     sendResponse: (response?: AutomationStateResponseMessage) => void
   ): void {
     const state = this.coordinator.getAutomationState();
-    const response: AutomationStateResponseMessage = {
-      type: 'AUTOMATION_STATE_RESPONSE',
-      payload: {
-        hasActiveAutomation: state.isActive,
-        currentSequence: state.currentSequence,
-        currentStepIndex: state.currentStepIndex,
-        pendingActions: state.pendingActions,
-      },
-    };
-    sendResponse(response);
+
+    // State snapshots are reused until the state changes, so the response
+    // built for one can be reused as well
+    if (this.stateResponseCache?.state !== state) {
+      this.stateResponseCache = {
+        state,
+        response: {
+          type: 'AUTOMATION_STATE_RESPONSE',
+          payload: {
+            hasActiveAutomation: state.isActive,
+            currentSequence: state.currentSequence,
+            currentStepIndex: state.currentStepIndex,
+            pendingActions: state.pendingActions,
+          },
+        },
+      };
+    }
+
+    sendResponse(this.stateResponseCache.response);
   }
 
   private handleSequenceComplete(message: SequenceCompleteMessage): void {
@@ -1,10 +1,7 @@
 import { ServiceFactory } from '@/services/DIContainer';
 import { AutomationCoordinator } from './AutomationCoordinator';
 import { MessageHandler } from './MessageHandler';
-import {
-  AutomationMessage,
-  UserResponseMessage,
-} from '@/services/AutomationEngine/MessageTypes';
+import { AutomationMessage } from '@/services/AutomationEngine/MessageTypes';
 import { browser } from 'wxt/browser';
 import { onMessage } from '@/services/Messaging/messaging';
 
@@ -107,21 +104,14 @@ export default defineBackground(() => {
     }
   });
 
-  // Handle USER_RESPONSE messages
-  browser.runtime.onMessage.addListener((message: UserResponseMessage) => {
-    if (message.type === 'USER_RESPONSE') {
-      const _userResponseMessage = message as UserResponseMessage;
-      // Forward to ActionProcessor via browser.runtime.sendMessage
-      // This will be handled by the ActionProcessor's message listener
-      return true; // Keep the message channel open
-    }
-  });
-
   // Listen for messages from content scripts
   browser.runtime.onMessage.addListener(
-    async (message: AutomationMessage, sender, sendResponse) => {
-      await messageHandler.handleMessage(message, sender, sendResponse);
-      return true; // Keep message channel open for async responses
+    (message: AutomationMessage, sender, sendResponse) => {
+      // Only claim routed messages; true keeps the channel open for the
+      // async response, undefined leaves the rest to other listeners
+      return messageHandler.handleMessage(message, sender, sendResponse)
+        ? true
+        : undefined;
     }
   );
 
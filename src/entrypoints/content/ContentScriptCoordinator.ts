@@ -9,6 +9,7 @@ import { ServiceCoordinator } from './ServiceCoordinator';
 import { AutomationStateManager } from './AutomationStateManager';
 import { ExtensionConfig } from '@/config/ExtensionConfig';
 import { SingletonManager } from '@/utils/SingletonService';
+import { LogLevel } from '@/utils/EnvironmentConfig';
 import { ErrorHandlingConfig } from '../../utils/ErrorHandlingUtils';
 
 /**
@@ -186,6 +187,11 @@ export class ContentScriptCoordinator {
         'ContentScriptCoordinator'
       );
 
+      // Per-element details are only worth computing when debug is enabled
+      if (!logger.isLevelEnabled(LogLevel.DEBUG)) {
+        return;
+      }
+
       // Log each element with details
       elements.forEach((element: Element, index: number) => {
         const tagName = element.tagName.toLowerCase();
@@ -200,6 +206,7 @@ export class ContentScriptCoordinator {
               0,
               ExtensionConfig.CONTENT_LIMITS.ELEMENT_TEXT_PREVIEW_LENGTH
             ) || '';
+        const rect = element.getBoundingClientRect();
 
         logger.debug(
           `${index + 1}. ${tagName}${id}${className}`,
@@ -208,10 +215,10 @@ export class ContentScriptCoordinator {
             element,
             text: text ? `"${text}"` : 'No text',
             position: {
-              x: element.getBoundingClientRect().left,
-              y: element.getBoundingClientRect().top,
-              width: element.getBoundingClientRect().width,
-              height: element.getBoundingClientRect().height,
+              x: rect.left,
+              y: rect.top,
+              width: rect.width,
+              height: rect.height,
             },
           }
         );
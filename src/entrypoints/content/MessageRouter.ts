@@ -1,6 +1,9 @@
 import { ServiceFactory } from '@/services/DIContainer';
 import { LoggingService } from '@/services/LoggingService';
-import { AutomationMessage } from '@/services/AutomationEngine/MessageTypes';
+import {
+  AutomationMessage,
+  AutomationMessageType,
+} from '@/services/AutomationEngine/MessageTypes';
 import { MessageResponse, MessageSender } from './ExtensionTypes';
 import { ContentScriptCoordinator } from './ContentScriptCoordinator';
 import { SingletonManager } from '@/utils/SingletonService';
@@ -9,6 +12,15 @@ import { SingletonManager } from '@/utils/SingletonService';
  * Message routing and handling for content script
  */
 export class MessageRouter {
+  // Message types the content script acts on; anything else is left to
+  // other listeners without being logged or routed
+  private static readonly ROUTED_TYPES: ReadonlySet<AutomationMessageType> =
+    new Set<AutomationMessageType>([
+      'EXECUTE_SEQUENCE',
+      'LIST_INTERACTIVE_ELEMENTS',
+      'START_AUTOMATION',
+      'STOP_AUTOMATION',
+    ]);
   private readonly logger: LoggingService;
   private isListenerRegistered = false;
   private coordinator: ContentScriptCoordinator | null = null;
@@ -55,12 +67,18 @@ export class MessageRouter {
 
     // Listen for messages from background
     browser.runtime.onMessage.addListener(
-      async (
+      (
         message: AutomationMessage,
         sender: MessageSender,
         sendResponse: MessageResponse
       ) => {
-        await this.handleMessage(message, sender, sendResponse);
+        // Cheap type lookup first, so unrelated traffic such as typed
+        // messaging calls is not claimed by this listener
+        if (!MessageRouter.ROUTED_TYPES.has(message?.type)) {
+          return undefined;
+        }
+
+        void this.handleMessage(message, sender, sendResponse);
         return true; // Keep message channel open for async responses
       }
     );
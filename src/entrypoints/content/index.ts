@@ -1,5 +1,6 @@
 import '@/styles/globals.css';
 import '@/styles/cursor.css';
+import { ExtensionConfig } from '@/config/ExtensionConfig';
 import { ServiceFactory } from '@/services/DIContainer';
 import { LoggingService } from '@/services/LoggingService';
 import { ContentScriptCoordinator } from './ContentScriptCoordinator';
@@ -239,12 +240,7 @@ async function initializeContentScript(): Promise<void> {
 
 // WXT content script definition
 export default defineContentScript({
-  matches: [
-    '*://*.jotform.com/*',
-    '*://*.sahibinden.com/*',
-    '*://*.arabam.com/*',
-    '*://*.chess.com/*',
-  ],
+  matches: [...ExtensionConfig.CONTENT_SCRIPT_MATCHES],
   runAt: 'document_end',
   allFrames: false,
   main() {
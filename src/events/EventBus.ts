@@ -18,7 +18,11 @@ interface EventSubscription {
 }
 
 export class EventBus {
-  private readonly subscriptions = new Map<EventType, EventSubscription[]>();
+  private readonly subscriptions = new Map<
+    EventType,
+    Map<string, EventSubscription>
+  >();
+  private readonly subscriptionTypes = new Map<string, EventType>();
   private readonly logger: LoggingService;
   private subscriptionCounter = 0;
 
@@ -54,10 +58,11 @@ export class EventBus {
     };
 
     if (!this.subscriptions.has(eventType)) {
-      this.subscriptions.set(eventType, []);
+      this.subscriptions.set(eventType, new Map());
     }
 
-    this.subscriptions.get(eventType)!.push(subscription);
+    this.subscriptions.get(eventType)!.set(subscriptionId, subscription);
+    this.subscriptionTypes.set(subscriptionId, eventType);
 
     this.logger.debug('EventBus', `Subscribed to ${eventType}`, {
       subscriptionId,
@@ -81,30 +86,36 @@ export class EventBus {
    * Unsubscribe from an event
    */
   public off(subscriptionId: string): boolean {
-    for (const [eventType, subscriptions] of this.subscriptions.entries()) {
-      const index = subscriptions.findIndex((sub) => sub.id === subscriptionId);
-      if (index !== -1) {
-        subscriptions.splice(index, 1);
-
-        // Clean up empty subscription arrays
-        if (subscriptions.length === 0) {
-          this.subscriptions.delete(eventType);
-        }
-
-        this.logger.debug('EventBus', `Unsubscribed from ${eventType}`, {
-          subscriptionId,
-        });
-        return true;
+    const eventType = this.subscriptionTypes.get(subscriptionId);
+    if (eventType === undefined) {
+      return false;
+    }
+
+    this.subscriptionTypes.delete(subscriptionId);
+    const subscriptions = this.subscriptions.get(eventType);
+    if (subscriptions) {
+      subscriptions.delete(subscriptionId);
+
+      // Clean up empty subscription maps
+      if (subscriptions.size === 0) {
+        this.subscriptions.delete(eventType);
       }
     }
-    return false;
+
+    this.logger.debug('EventBus', `Unsubscribed from ${eventType}`, {
+      subscriptionId,
+    });
+    return true;
   }
 
   /**
    * Emit an event to all subscribers
    */
   public async emit<T extends ExtensionEvent>(event: T): Promise<void> {
-    const subscriptions = this.subscriptions.get(event.type) || [];
+    // Snapshot so handlers that subscribe/unsubscribe don't disturb dispatch
+    const subscriptions = [
+      ...(this.subscriptions.get(event.type)?.values() ?? []),
+    ];
 
     if (subscriptions.length === 0) {
       this.logger.debug('EventBus', `No subscribers for event ${event.type}`);
@@ -116,15 +127,18 @@ export class EventBus {
       event,
     });
 
+    // Remove one-time subscriptions before dispatch so overlapping emits
+    // cannot deliver the same event to them twice
+    for (const subscription of subscriptions) {
+      if (subscription.once) {
+        this.off(subscription.id);
+      }
+    }
+
     // Process subscriptions in parallel
     const promises = subscriptions.map(async (subscription) => {
       try {
         await subscription.handler(event);
-
-        // Remove one-time subscriptions
-        if (subscription.once) {
-          this.off(subscription.id);
-        }
       } catch (error: unknown) {
         this.logger.error(
           'EventBus',
@@ -145,10 +159,15 @@ export class EventBus {
    */
   public removeAllListeners(eventType?: EventType): void {
     if (eventType) {
+      const subscriptions = this.subscriptions.get(eventType);
+      subscriptions?.forEach((_subscription, subscriptionId) =>
+        this.subscriptionTypes.delete(subscriptionId)
+      );
       this.subscriptions.delete(eventType);
       this.logger.debug('EventBus', `Removed all listeners for ${eventType}`);
     } else {
       this.subscriptions.clear();
+      this.subscriptionTypes.clear();
       this.logger.debug('EventBus', 'Removed all event listeners');
     }
   }
@@ -157,7 +176,7 @@ export class EventBus {
    * Get the number of subscribers for an event type
    */
   public getSubscriberCount(eventType: EventType): number {
-    return this.subscriptions.get(eventType)?.length ?? 0;
+    return this.subscriptions.get(eventType)?.size ?? 0;
   }
 
   /**
@@ -175,8 +194,8 @@ export class EventBus {
 
     for (const [eventType, subscriptions] of this.subscriptions.entries()) {
       info[eventType] = {
-        subscriberCount: subscriptions.length,
-        subscriptions: subscriptions.map((sub) => ({
+        subscriberCount: subscriptions.size,
+        subscriptions: Array.from(subscriptions.values(), (sub) => ({
           id: sub.id,
           once: sub.once,
         })),
@@ -185,10 +204,7 @@ export class EventBus {
 
     return {
       totalEventTypes: this.subscriptions.size,
-      totalSubscriptions: Array.from(this.subscriptions.values()).reduce(
-        (sum, subs) => sum + subs.length,
-        0
-      ),
+      totalSubscriptions: this.subscriptionTypes.size,
       events: info,
     };
   }
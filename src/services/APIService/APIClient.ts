@@ -13,18 +13,18 @@ import { ServiceFactory } from '@/services/DIContainer';
 import { LoggingService } from '@/services/LoggingService';
 
 export class APIClient {
+  // Shared by every request instead of being rebuilt per client or call
+  private static readonly DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    Accept: 'application/json',
+  } as const;
   private readonly config: APIConfig;
   private readonly logger: LoggingService;
-  private readonly defaultHeaders: Record<string, string>;
 
   constructor(config: APIConfig) {
     this.config = config;
     const serviceFactory = ServiceFactory.getInstance();
     this.logger = serviceFactory.createLoggingService();
-    this.defaultHeaders = {
-      'Content-Type': 'application/json',
-      Accept: 'application/json',
-    };
   }
 
   private async executeWithRetry<T>(
@@ -55,7 +55,7 @@ export class APIClient {
           data,
           status: fetchResponse.status,
           statusText: fetchResponse.statusText,
-          headers: Object.fromEntries(fetchResponse.headers.entries()),
+          headers: fetchResponse.headers,
         };
       } catch (error) {
         lastError = error as Error;
@@ -98,21 +98,21 @@ export class APIClient {
     const timeout = requestConfig?.timeout ?? this.config.getTimeout();
     const url = this.config.getEndpointUrl('INIT_SESSION');
 
-    this.logger.debug(`API Request: POST ${url}`, 'APIClient');
+    // Serialize once; retries resend the same body
+    const body = JSON.stringify(request);
 
-    return this.executeWithRetry(() => {
-      const controller = new AbortController();
-      if (timeout) {
-        setTimeout(() => controller.abort(), timeout);
-      }
+    this.logger.debug(`API Request: POST ${url}`, 'APIClient');
 
-      return fetch(url, {
-        method: 'POST',
-        headers: this.defaultHeaders,
-        body: JSON.stringify(request),
-        signal: controller.signal,
-      });
-    }, requestConfig);
+    return this.executeWithRetry(
+      () =>
+        fetch(url, {
+          method: 'POST',
+          headers: APIClient.DEFAULT_HEADERS,
+          body,
+          signal: timeout ? AbortSignal.timeout(timeout) : undefined,
+        }),
+      requestConfig
+    );
   }
 
   async nextAction(
@@ -122,32 +122,29 @@ export class APIClient {
     const timeout = requestConfig?.timeout ?? this.config.getTimeout();
     const url = this.config.getEndpointUrl('NEXT_ACTION');
 
-    this.logger.debug(`API Request: POST ${url}`, 'APIClient');
+    // Serialize once; retries resend the same body
+    const body = JSON.stringify(request);
 
-    return this.executeWithRetry(() => {
-      const controller = new AbortController();
-      if (timeout) {
-        setTimeout(() => controller.abort(), timeout);
-      }
+    this.logger.debug(`API Request: POST ${url}`, 'APIClient');
 
-      return fetch(url, {
-        method: 'POST',
-        headers: this.defaultHeaders,
-        body: JSON.stringify(request),
-        signal: controller.signal,
-      });
-    }, requestConfig);
+    return this.executeWithRetry(
+      () =>
+        fetch(url, {
+          method: 'POST',
+          headers: APIClient.DEFAULT_HEADERS,
+          body,
+          signal: timeout ? AbortSignal.timeout(timeout) : undefined,
+        }),
+      requestConfig
+    );
   }
 
   async healthCheck(): Promise<boolean> {
     try {
-      const controller = new AbortController();
-      setTimeout(() => controller.abort(), TimingConfig.API_TIMEOUT);
-
-      const response = await fetch(`${this.config.getBaseUrl()}/health`, {
+      const response = await fetch(this.config.getHealthUrl(), {
         method: 'GET',
-        headers: this.defaultHeaders,
-        signal: controller.signal,
+        headers: APIClient.DEFAULT_HEADERS,
+        signal: AbortSignal.timeout(TimingConfig.API_TIMEOUT),
       });
 
       return response.status === 200;
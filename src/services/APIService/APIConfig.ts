@@ -1,19 +1,22 @@
 import { EnvironmentConfig } from '../../utils/EnvironmentConfig';
+import { API_ENDPOINTS } from './APITypes';
 
 export class APIConfig {
   private static readonly DEFAULT_TIMEOUT = 30000 as const;
   private static readonly DEFAULT_RETRY_ATTEMPTS = 3 as const;
   private static readonly DEFAULT_RETRY_DELAY = 1000 as const;
 
-  static readonly ENDPOINTS = {
-    INIT_SESSION: '/agent/init',
-    NEXT_ACTION: '/agent/next_action',
-  } as const;
+  static readonly ENDPOINTS = API_ENDPOINTS;
 
   private readonly baseUrl: string;
   private readonly timeout: number;
   private readonly retryAttempts: number;
   private readonly retryDelay: number;
+  private readonly endpointUrls: Record<
+    keyof typeof APIConfig.ENDPOINTS,
+    string
+  >;
+  private readonly healthUrl: string;
 
   constructor(config?: Partial<APIConfigOptions>) {
     this.baseUrl = EnvironmentConfig.getInstance().getBackendBaseUrl();
@@ -21,6 +24,11 @@ export class APIConfig {
     this.retryAttempts =
       config?.retryAttempts ?? APIConfig.DEFAULT_RETRY_ATTEMPTS;
     this.retryDelay = config?.retryDelay ?? APIConfig.DEFAULT_RETRY_DELAY;
+    this.endpointUrls = {
+      INIT_SESSION: `${this.baseUrl}${APIConfig.ENDPOINTS.INIT_SESSION}`,
+      NEXT_ACTION: `${this.baseUrl}${APIConfig.ENDPOINTS.NEXT_ACTION}`,
+    };
+    this.healthUrl = `${this.baseUrl}/health`;
   }
 
   getBaseUrl(): string {
@@ -39,8 +47,15 @@ export class APIConfig {
     return this.retryDelay;
   }
 
+  /**
+   * Endpoint URLs are resolved once per config since the base URL is fixed
+   */
   getEndpointUrl(endpoint: keyof typeof APIConfig.ENDPOINTS): string {
-    return `${this.baseUrl}${APIConfig.ENDPOINTS[endpoint]}`;
+    return this.endpointUrls[endpoint];
+  }
+
+  getHealthUrl(): string {
+    return this.healthUrl;
   }
 
   static getDefaultConfig(): APIConfig {
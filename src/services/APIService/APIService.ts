@@ -58,8 +58,8 @@ export class APIService {
           requestConfig
         );
 
-        this.logger.info(
-          `Received response from API: ${JSON.stringify(response)}`,
+        this.logger.debug(
+          () => `Received response from API: ${JSON.stringify(response.data)}`,
           'APIService'
         );
 
@@ -137,14 +137,26 @@ export class APIService {
 
       const response = await this.apiClient.nextAction(request, requestConfig);
 
+      // Validate the shape once here so downstream code can trust it
+      const data = APIErrorHandler.validateAPIResponse(
+        response.data,
+        APIService.isNextActionResponse,
+        {
+          context: 'APIService',
+          operation: 'getNextAction',
+          endpoint: APIConfig.ENDPOINTS.NEXT_ACTION,
+        },
+        this.logger
+      );
+
       this.logger.debug(
-        `Next action response: ${response.data.actions.length} actions received`,
+        `Next action response: ${data.actions.length} actions received`,
         'APIService'
       );
-      if (response.data.actions[0].type === 'ASK_USER') {
-        response.data.actions[0].type = 'FINISH';
+      if (data.actions[0]?.type === 'ASK_USER') {
+        data.actions[0].type = 'FINISH';
       }
-      return response.data;
+      return data;
     } catch (error) {
       this.logger.logError(error as Error, 'APIService');
       throw new APIError(
@@ -202,6 +214,28 @@ export class APIService {
     this.logger.debug('Session cleared', 'APIService');
   }
 
+  /**
+   * Check that a next action payload has the fields the engine relies on
+   */
+  private static isNextActionResponse(
+    data: unknown
+  ): data is NextActionResponse {
+    if (!data || typeof data !== 'object') {
+      return false;
+    }
+
+    const { actions } = data as Partial<NextActionResponse>;
+    return (
+      Array.isArray(actions) &&
+      actions.every(
+        (action) =>
+          !!action &&
+          typeof action === 'object' &&
+          typeof action.type === 'string'
+      )
+    );
+  }
+
   private validateObjective(objective: string): void {
     if (!objective || typeof objective !== 'string') {
       throw new APIValidationError('objective', objective);
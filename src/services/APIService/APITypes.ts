@@ -46,7 +46,7 @@ export interface APIResponse<T> {
   data: T;
   status: number;
   statusText: string;
-  headers: Record<string, string>;
+  headers: Headers;
 }
 
 export interface APIErrorResponse {
@@ -4,6 +4,9 @@ export interface BaseAutomationAction {
   type: AutomationActionType;
   description: string;
   delay?: number;
+  // Selector to wait for after the action; takes precedence over delay
+  waitFor?: string;
+  maxWaitMs?: number;
 }
 
 export interface NavigationAction extends BaseAutomationAction {
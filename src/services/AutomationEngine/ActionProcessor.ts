@@ -172,7 +172,8 @@ export class ActionProcessor {
       }
     }
 
-    if (!actionResponse.actions || actionResponse.actions.length === 0) {
+    // APIService has already validated that actions is an array
+    if (actionResponse.actions.length === 0) {
       this.logger.info(
         'No actions received from backend, ending automation',
         'ActionProcessor'
@@ -176,7 +176,8 @@ export class AutomationEngine {
    */
   async handleMessage(message: AutomationMessage): Promise<void> {
     this.logger.info(
-      `AutomationEngine.handleMessage received message type: ${message.type}`,
+      () =>
+        `AutomationEngine.handleMessage received message type: ${message.type}`,
       'AutomationEngine'
     );
 
@@ -264,10 +265,12 @@ export class AutomationEngine {
       );
 
       if (!result.success) {
+        const failedAt = Date.now();
+
         // Emit automation error event
         await this.eventBus.emit({
           type: EventTypes.AUTOMATION_ERROR,
-          timestamp: Date.now(),
+          timestamp: failedAt,
           sessionId,
           error: result.error!,
           context: { message: message.payload },
@@ -277,7 +280,7 @@ export class AutomationEngine {
         // Emit automation stopped event
         await this.eventBus.emit({
           type: EventTypes.AUTOMATION_STOPPED,
-          timestamp: Date.now(),
+          timestamp: failedAt,
           sessionId,
           reason: 'error',
           source: 'AutomationEngine',
@@ -355,10 +358,12 @@ export class AutomationEngine {
       );
 
       if (!result.success) {
+        const failedAt = Date.now();
+
         // Emit automation error event
         await this.eventBus.emit({
           type: EventTypes.AUTOMATION_ERROR,
-          timestamp: Date.now(),
+          timestamp: failedAt,
           sessionId,
           error: result.error!,
           context: { objective: message.payload.objective },
@@ -368,7 +373,7 @@ export class AutomationEngine {
         // Emit automation stopped event for error case
         await this.eventBus.emit({
           type: EventTypes.AUTOMATION_STOPPED,
-          timestamp: Date.now(),
+          timestamp: failedAt,
           sessionId,
           reason: 'error',
           source: 'AutomationEngine',
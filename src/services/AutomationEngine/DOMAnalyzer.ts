@@ -22,20 +22,24 @@ export class DOMAnalyzer {
    * Wait for DOM to be ready and analyze it
    */
   async waitForDOMReady(): Promise<void> {
+    let timeoutId: ReturnType<typeof setTimeout> | undefined;
+
     try {
       await Promise.race([
         this.domDetectionService.waitForDOMAndAnalyze(),
-        new Promise((_, reject) =>
-          setTimeout(
+        new Promise((_, reject) => {
+          timeoutId = setTimeout(
             () => reject(new Error('DOM load timeout')),
             this.domLoadTimeout
-          )
-        ),
+          );
+        }),
       ]);
     } catch (error) {
       const errorMessage = `DOM loading failed: ${error instanceof Error ? error.message : 'Unknown error'}`;
       this.logger.error(errorMessage, 'DOMAnalyzer');
       throw new AutomationError(errorMessage);
+    } finally {
+      clearTimeout(timeoutId);
     }
   }
 
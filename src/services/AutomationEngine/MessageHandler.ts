@@ -24,7 +24,7 @@ export class MessageHandler {
     onExecuteSequence: (message: ExecuteSequenceMessage) => Promise<void>
   ): Promise<void> {
     this.logger.info(
-      `MessageHandler received message: ${message.type}`,
+      () => `MessageHandler received message: ${message.type}`,
       'MessageHandler'
     );
     this.logger.debug('Message payload:', 'MessageHandler', {
@@ -81,7 +81,7 @@ export class MessageHandler {
 
       await browser.runtime.sendMessage(progressMessage);
       this.logger.info(
-        `Progress update sent: step ${completedStepIndex} completed`,
+        () => `Progress update sent: step ${completedStepIndex} completed`,
         'MessageHandler'
       );
     } catch (error) {
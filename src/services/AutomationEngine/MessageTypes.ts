@@ -63,7 +63,7 @@ export interface AutomationStateResponseMessage extends BaseAutomationMessage {
     hasActiveAutomation: boolean;
     currentSequence?: AutomationSequence;
     currentStepIndex?: number;
-    pendingActions?: AutomationAction[];
+    pendingActions?: readonly AutomationAction[];
   };
 }
 
@@ -56,7 +56,9 @@ export class SequenceAutomationOrchestrator {
         // Send progress update to background script
         await this.messageHandler.sendProgressUpdate(i, sequence.id);
 
-        if (action.delay) {
+        if (action.waitFor) {
+          await this.waitForSelector(action.waitFor, action.maxWaitMs);
+        } else if (action.delay) {
           await this.wait(action.delay);
         }
       }
@@ -97,6 +99,22 @@ export class SequenceAutomationOrchestrator {
     return new Promise((resolve) => setTimeout(resolve, ms));
   }
 
+  /**
+   * Wait until the selector is present instead of sleeping a fixed delay
+   */
+  private async waitForSelector(
+    selector: string,
+    maxWaitMs?: number
+  ): Promise<void> {
+    this.logger.debug(
+      `Waiting for selector: ${selector}`,
+      'SequenceAutomationOrchestrator'
+    );
+    await this.actionsService
+      .getElementUtils()
+      .waitForElement(selector, maxWaitMs);
+  }
+
   /**
    * Get current step index from error context
    */
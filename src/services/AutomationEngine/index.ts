@@ -4,7 +4,7 @@
  */
 
 export { AutomationEngine } from './AutomationEngine';
-export { AutomationConfig } from './AutomationConfig';
+export { AutomationConfig } from '@/config/AutomationConfig';
 export { MessageHandler } from './MessageHandler';
 
 // Export error classes
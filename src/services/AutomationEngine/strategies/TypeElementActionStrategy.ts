@@ -78,7 +78,7 @@ export class TypeElementActionStrategy extends BaseAutomationActionStrategy {
       await typingService.simulateRealisticTyping(targetElement, typeValue, {
         speedMultiplier: 1.0, // Normal human typing speed
         onProgress: (currentText: string) => {
-          this.logger.debug(`Typing progress: ${currentText}`);
+          this.logger.debug(() => `Typing progress: ${currentText}`);
         },
         onComplete: () => {
           this.logger.debug('Typing completed');
@@ -72,6 +72,8 @@ export class CursorBasedElementDetector {
       }
       const visibleElements: HTMLElement[] = [];
       let count = 0;
+      // Blocker state cannot change during this synchronous scan
+      const isBlockerActive = UserInteractionBlocker.getInstance().isActive;
       allElements.forEach((element) => {
         const htmlElement = element as HTMLElement;
 
@@ -80,8 +82,10 @@ export class CursorBasedElementDetector {
         }
 
         if (this.hasInteractiveCursorStyle(htmlElement)) {
-          if (this.isElementInViewport(htmlElement)) {
-            if (this.isElementTopmost(htmlElement)) {
+          // Read layout once and share it between the geometry checks
+          const rect = htmlElement.getBoundingClientRect();
+          if (this.isElementInViewport(rect)) {
+            if (this.isElementTopmost(htmlElement, rect, isBlockerActive)) {
               count += 1;
               if (!loggedElements.has(htmlElement)) {
                 // this.logInteractiveElement(htmlElement);
@@ -161,9 +165,7 @@ export class CursorBasedElementDetector {
   /**
    * Checks if an element is in the viewport and has non-zero dimensions
    */
-  private isElementInViewport(element: HTMLElement): boolean {
-    const rect = element.getBoundingClientRect();
-
+  private isElementInViewport(rect: DOMRect): boolean {
     // Check if element has non-zero dimensions
     if (rect.width <= 0 || rect.height <= 0) {
       return false;
@@ -183,8 +185,11 @@ export class CursorBasedElementDetector {
    * Checks if an element is the topmost element at its center point
    * Handles UserInteractionBlocker overlay during automation
    */
-  private isElementTopmost(element: HTMLElement): boolean {
-    const rect = element.getBoundingClientRect();
+  private isElementTopmost(
+    element: HTMLElement,
+    rect: DOMRect,
+    isBlockerActive: boolean
+  ): boolean {
     const x = rect.left + rect.width / 2;
     const y = rect.top + rect.height / 2;
 
@@ -192,15 +197,14 @@ export class CursorBasedElementDetector {
     const elementsAtPoint = document.elementsFromPoint(x, y);
 
     // Filter out the UserInteractionBlocker overlay if present
-    const userBlocker = UserInteractionBlocker.getInstance();
-    const filteredElements = elementsAtPoint.filter(
-      (el) =>
-        !(
-          el.classList.contains(
-            EXTENSION_COMPONENTS.INTERACTION_BLOCKER_CLASS
-          ) && userBlocker.isActive
+    const filteredElements = isBlockerActive
+      ? elementsAtPoint.filter(
+          (el) =>
+            !el.classList.contains(
+              EXTENSION_COMPONENTS.INTERACTION_BLOCKER_CLASS
+            )
         )
-    );
+      : elementsAtPoint;
 
     // Get the topmost non-blocker element
     const topElement = filteredElements.length > 0 ? filteredElements[0] : null;
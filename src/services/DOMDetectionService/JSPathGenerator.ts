@@ -7,6 +7,7 @@ export class JSPathGenerator {
   private static readonly DOCUMENT_SELECTOR = 'document';
   private static readonly QUERY_SELECTOR = 'querySelector';
   private static readonly QUERY_SELECTOR_ALL = 'querySelectorAll';
+  private static readonly TEST_ID_ATTRIBUTE = 'data-testid';
 
   /**
    * Generates a JavaScript path to access the given element
@@ -48,6 +49,12 @@ export class JSPathGenerator {
         return idPath;
       }
 
+      // Try test id next, a single attribute lookup instead of a deep chain
+      const testIdPath = this.generateTestIdPath(element);
+      if (testIdPath) {
+        return testIdPath;
+      }
+
       // Try unique selector path
       const selectorPath = this.generateSelectorPath(element);
       if (selectorPath) {
@@ -77,6 +84,9 @@ export class JSPathGenerator {
       const idPath = this.generateIdPath(element);
       if (idPath) paths.push(idPath);
 
+      const testIdPath = this.generateTestIdPath(element);
+      if (testIdPath) paths.push(testIdPath);
+
       const selectorPath = this.generateSelectorPath(element);
       if (selectorPath) {
         paths.push(
@@ -116,6 +126,21 @@ export class JSPathGenerator {
     return null;
   }
 
+  private static generateTestIdPath(element: HTMLElement): string | null {
+    const testId = element.getAttribute(this.TEST_ID_ATTRIBUTE);
+    if (!testId) {
+      return null;
+    }
+
+    // CSS-escape for the lookup, then JS-escape once for the string literal
+    const selector = `[${this.TEST_ID_ATTRIBUTE}="${CSS.escape(testId)}"]`;
+    if (document.querySelectorAll(selector).length !== 1) {
+      return null;
+    }
+
+    return `${this.DOCUMENT_SELECTOR}.${this.QUERY_SELECTOR}('${this.escapeSelector(selector)}')`;
+  }
+
   private static generateSelectorPath(element: HTMLElement): string | null {
     const selectors: string[] = [];
     let currentElement: Element | null = element;
@@ -18,6 +18,9 @@ export class JotformAgentDisabler {
       '#form-agent-helper',
     ],
   } as const;
+  // Compound selector is built once rather than on every mutation batch
+  private static readonly ALL_AGENT_SELECTOR =
+    JotformAgentDisabler.JOTFORM_AGENT.ALL_AGENT_PATTERNS.join(', ');
   private readonly logger: LoggingService;
   private mutationObserver: MutationObserver | null = null;
   private isObserving = false;
@@ -217,10 +220,14 @@ export class JotformAgentDisabler {
     let foundElements = 0;
 
     // Check if the context element itself matches any agent pattern (for mutations)
-    if (checkSelf && context instanceof Element) {
+    if (
+      checkSelf &&
+      context instanceof Element &&
+      context.matches?.(JotformAgentDisabler.ALL_AGENT_SELECTOR)
+    ) {
       for (const pattern of JotformAgentDisabler.JOTFORM_AGENT
         .ALL_AGENT_PATTERNS) {
-        if (context.matches && context.matches(pattern)) {
+        if (context.matches(pattern)) {
           this.disableAgentComponent(context as HTMLElement);
           foundElements++;
           this.logger.info(
@@ -233,9 +240,9 @@ export class JotformAgentDisabler {
     }
 
     // Use single compound selector for better performance
-    const allPatterns =
-      JotformAgentDisabler.JOTFORM_AGENT.ALL_AGENT_PATTERNS.join(', ');
-    const elements = context.querySelectorAll(allPatterns);
+    const elements = context.querySelectorAll(
+      JotformAgentDisabler.ALL_AGENT_SELECTOR
+    );
 
     elements.forEach((element) => {
       this.disableAgentComponent(element as HTMLElement);
@@ -5,17 +5,25 @@
 import { EnvironmentConfig, LogLevel } from '../utils/EnvironmentConfig';
 import { LoggingConfig } from '../config';
 import { SingletonManager } from '../utils/SingletonService';
+import { TimestampUtils } from '../utils/TimestampUtils';
+
+/**
+ * Log message, or a thunk that is only evaluated when the level is enabled
+ */
+export type LogMessage = string | (() => string);
 
 export interface LogEntry {
   level: LogLevel;
   message: string;
-  timestamp: Date;
+  timestamp: number;
   context?: string;
   data?: Record<string, unknown>;
 }
 
 export class LoggingService {
+  // Ring buffer of recent entries; logHead is the oldest once it is full
   private logs: LogEntry[] = [];
+  private logHead = 0;
   private readonly maxLogs = LoggingConfig.LIMITS.MAX_LOGS;
   private readonly logLevel =
     EnvironmentConfig.getInstance().getDebugLogLevel();
@@ -56,7 +64,7 @@ export class LoggingService {
    */
   private createLogMethod(level: LogLevel) {
     return (
-      message: string,
+      message: LogMessage,
       context?: string,
       data?: Record<string, unknown>
     ): void => {
@@ -64,6 +72,14 @@ export class LoggingService {
     };
   }
 
+  /**
+   * Check whether messages at the given level would be recorded
+   * Lets callers skip building expensive log payloads
+   */
+  isLevelEnabled(level: LogLevel): boolean {
+    return level >= this.logLevel;
+  }
+
   /**
    * Log error object
    */
@@ -79,28 +95,28 @@ export class LoggingService {
    */
   private log(
     level: LogLevel,
-    message: string,
+    message: LogMessage,
     context?: string,
     data?: Record<string, unknown>
   ): void {
-    if (level < this.logLevel) {
+    if (!this.isLevelEnabled(level)) {
       return;
     }
 
     const entry: LogEntry = {
       level,
-      message,
-      timestamp: new Date(),
+      message: typeof message === 'function' ? message() : message,
+      timestamp: Date.now(),
       context,
       data: this.sanitizeData(data),
     };
 
-    // Add to in-memory logs
-    this.logs.push(entry);
-
-    // Maintain max log limit
-    if (this.logs.length > this.maxLogs) {
-      this.logs.shift();
+    // Add to in-memory logs, overwriting the oldest entry once full
+    if (this.logs.length < this.maxLogs) {
+      this.logs.push(entry);
+    } else {
+      this.logs[this.logHead] = entry;
+      this.logHead = (this.logHead + 1) % this.maxLogs;
     }
 
     // Output to console
@@ -151,7 +167,7 @@ export class LoggingService {
    * Output log entry to console
    */
   private outputToConsole(entry: LogEntry): void {
-    const prefix = `[${entry.timestamp.toISOString()}]`;
+    const prefix = `[${TimestampUtils.toISOString(entry.timestamp)}]`;
     const contextStr = entry.context ? ` [${entry.context}]` : '';
     const fullMessage = `${prefix}${contextStr} ${entry.message}`;
 
@@ -179,7 +195,13 @@ export class LoggingService {
   getRecentLogs(
     count: number = LoggingConfig.LIMITS.RECENT_LOGS_COUNT
   ): LogEntry[] {
-    return this.logs.slice(-count);
+    const ordered =
+      this.logHead === 0
+        ? this.logs
+        : this.logs
+            .slice(this.logHead)
+            .concat(this.logs.slice(0, this.logHead));
+    return ordered.slice(-count);
   }
 
   /**
@@ -187,5 +209,6 @@ export class LoggingService {
    */
   clearLogs(): void {
     this.logs = [];
+    this.logHead = 0;
   }
 }
@@ -39,11 +39,11 @@ export class CursorAnimationManager {
       VisualCursorConfig.TIMING_CONSTANTS.minAnimationDuration,
       distance * config.animationSpeed
     );
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     return new Promise<CursorPosition>((resolve) => {
       const animate = () => {
-        const elapsed = Date.now() - startTime;
+        const elapsed = performance.now() - startTime;
         const progress = Math.min(elapsed / duration, 1);
         const easeProgress = this.easeInOutCubic(progress);
 
@@ -42,19 +42,17 @@ export class APIErrorHandler {
     config: APIErrorConfig,
     logger: LoggingService
   ): Promise<T> {
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     return ErrorHandlingUtils.executeWithRetry(
       async () => {
         try {
-          const result = await Promise.race([
+          const result = await this.withTimeout(
             request(),
-            this.createTimeoutPromise<T>(
-              config.timeout || this.DEFAULT_TIMEOUT
-            ),
-          ]);
+            config.timeout || this.DEFAULT_TIMEOUT
+          );
 
-          const duration = Date.now() - startTime;
+          const duration = Math.round(performance.now() - startTime);
           logger.debug(
             `API request completed successfully in ${duration}ms`,
             config.context,
@@ -239,14 +237,24 @@ export class APIErrorHandler {
   }
 
   /**
-   * Create timeout promise for race condition
+   * Race a request against a timeout, clearing the timer once settled
    */
-  private static createTimeoutPromise<T>(timeout: number): Promise<T> {
-    return new Promise((_, reject) => {
-      setTimeout(() => {
+  private static async withTimeout<T>(
+    request: Promise<T>,
+    timeout: number
+  ): Promise<T> {
+    let timeoutId: ReturnType<typeof setTimeout> | undefined;
+    const timeoutPromise = new Promise<never>((_, reject) => {
+      timeoutId = setTimeout(() => {
         reject(new Error('TimeoutError'));
       }, timeout);
     });
+
+    try {
+      return await Promise.race([request, timeoutPromise]);
+    } finally {
+      clearTimeout(timeoutId);
+    }
   }
 
   /**
@@ -36,10 +36,14 @@ export class DOMErrorHandler {
       const element = container.querySelector<T>(selector);
 
       if (!element) {
-        logger.debug(`Element not found with selector: ${selector}`, context, {
-          selector,
-          containerType: container.constructor.name,
-        });
+        logger.debug(
+          () => `Element not found with selector: ${selector}`,
+          context,
+          {
+            selector,
+            containerType: container.constructor.name,
+          }
+        );
       }
 
       return element;
@@ -107,7 +111,7 @@ export class DOMErrorHandler {
     container: Document | Element = document,
     timeout: number = TimingConfig.DOM_OPERATION_TIMEOUT
   ): Promise<T | null> {
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     return ErrorHandlingUtils.executeWithRetry(
       async () => {
@@ -119,7 +123,7 @@ export class DOMErrorHandler {
         );
 
         if (!element) {
-          if (Date.now() - startTime > timeout) {
+          if (performance.now() - startTime > timeout) {
             throw new DOMTimeoutError(
               `Element not found within ${timeout}ms`,
               selector,
@@ -1,6 +1,6 @@
 import { LoggingService } from '../services/LoggingService';
 import { TimingConfig } from '../config';
-import { AutomationConfig } from '@/services/AutomationEngine/AutomationConfig';
+import { AutomationConfig } from '@/config/AutomationConfig';
 import { ErrorHandlingConfig } from './ErrorHandlingUtils';
 
 /**
@@ -8,9 +8,8 @@ import { ErrorHandlingConfig } from './ErrorHandlingUtils';
  */
 export class ElementUtils {
   private readonly logger: LoggingService;
-  private readonly DEFAULT_TIMEOUT = AutomationConfig.TIMEOUTS.DEFAULT_TIMEOUT;
-  private readonly NAVIGATION_TIMEOUT =
-    AutomationConfig.TIMEOUTS.NAVIGATION_TIMEOUT;
+  private readonly DEFAULT_TIMEOUT = AutomationConfig.TIMEOUTS.DEFAULT;
+  private readonly NAVIGATION_TIMEOUT = AutomationConfig.TIMEOUTS.NAVIGATION;
 
   constructor(logger: LoggingService) {
     this.logger = logger;
@@ -18,53 +17,52 @@ export class ElementUtils {
 
   /**
    * Wait for an element to appear in the DOM with timeout
+   * Re-checks when the DOM mutates, at most once per element check interval
    */
   async waitForElement(
     selector: string,
     timeout: number = this.DEFAULT_TIMEOUT
   ): Promise<Element | null> {
     return new Promise((resolve) => {
-      const startTime = Date.now();
+      const startTime = performance.now();
+      const checkInterval = AutomationConfig.INTERVALS.ELEMENT_CHECK;
       let attemptCount = 0;
+      let lastCheckTime = startTime;
+      let observer: MutationObserver | null = null;
+      let timeoutId: ReturnType<typeof setTimeout> | null = null;
+      let checkTimerId: ReturnType<typeof setTimeout> | null = null;
+      let logTimerId: ReturnType<typeof setInterval> | null = null;
 
-      const checkElement = () => {
+      const finish = (element: Element | null) => {
+        observer?.disconnect();
+        if (timeoutId !== null) {
+          clearTimeout(timeoutId);
+        }
+        if (checkTimerId !== null) {
+          clearTimeout(checkTimerId);
+        }
+        if (logTimerId !== null) {
+          clearInterval(logTimerId);
+        }
+        resolve(element);
+      };
+
+      const checkElement = (): boolean => {
         try {
           attemptCount++;
+          lastCheckTime = performance.now();
           const element = document.querySelector(selector);
 
           if (element) {
             this.logger.info(
-              `Element found after ${attemptCount} attempts (${Date.now() - startTime}ms): ${selector}`,
-              'ElementUtils'
-            );
-            resolve(element);
-            return;
-          }
-
-          const elapsed = Date.now() - startTime;
-          if (elapsed > timeout) {
-            this.logger.warn(
-              `Element timeout after ${attemptCount} attempts (${elapsed}ms): ${selector}`,
-              'ElementUtils'
-            );
-            resolve(null);
-            return;
-          }
-
-          // Log every 2 seconds to track progress
-          if (
-            attemptCount %
-              (AutomationConfig.INTERVALS.ELEMENT_LOG_INTERVAL /
-                AutomationConfig.INTERVALS.ELEMENT_CHECK_INTERVAL) ===
-            0
-          ) {
-            this.logger.debug(
-              `Still waiting for element (${elapsed}ms, ${attemptCount} attempts): ${selector}`,
+              `Element found after ${attemptCount} attempts (${Math.round(lastCheckTime - startTime)}ms): ${selector}`,
               'ElementUtils'
             );
+            finish(element);
+            return true;
           }
 
-          setTimeout(checkElement, TimingConfig.ELEMENT_WAIT_RETRY_DELAY);
+          return false;
         } catch (error) {
           const config: ErrorHandlingConfig = {
             context: 'ElementUtils',
@@ -72,11 +70,54 @@ export class ElementUtils {
           };
           const errorMessage = `${config.operation} failed: Error checking element: ${selector}`;
           this.logger.error(errorMessage, config.context, { error });
-          resolve(null);
+          finish(null);
+          return true;
         }
       };
 
-      checkElement();
+      // Coalesce mutation bursts into one query per check interval
+      const scheduleCheck = () => {
+        if (checkTimerId !== null) {
+          return;
+        }
+
+        const delay = Math.max(
+          0,
+          lastCheckTime + checkInterval - performance.now()
+        );
+        checkTimerId = setTimeout(() => {
+          checkTimerId = null;
+          checkElement();
+        }, delay);
+      };
+
+      if (checkElement()) {
+        return;
+      }
+
+      observer = new MutationObserver(scheduleCheck);
+      observer.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+      });
+
+      // Log periodically to track progress
+      logTimerId = setInterval(() => {
+        this.logger.debug(
+          () =>
+            `Still waiting for element (${Math.round(performance.now() - startTime)}ms, ${attemptCount} attempts): ${selector}`,
+          'ElementUtils'
+        );
+      }, AutomationConfig.INTERVALS.ELEMENT_LOG);
+
+      timeoutId = setTimeout(() => {
+        this.logger.warn(
+          `Element timeout after ${attemptCount} attempts (${Math.round(performance.now() - startTime)}ms): ${selector}`,
+          'ElementUtils'
+        );
+        finish(null);
+      }, timeout);
     });
   }
 
@@ -86,8 +127,8 @@ export class ElementUtils {
    */
   async waitForNavigationComplete(): Promise<void> {
     return new Promise((resolve) => {
-      const startTime = Date.now();
-      let lastDomChangeTime = Date.now();
+      const startTime = performance.now();
+      let lastDomChangeTime = startTime;
       let stabilityCheckCount = 0;
       const STABILITY_THRESHOLD = 3; // Number of consecutive stable checks needed
       const STABILITY_CHECK_INTERVAL = 500; // ms between stability checks
@@ -100,7 +141,7 @@ export class ElementUtils {
 
           // Start monitoring DOM stability
           const observer = new MutationObserver(() => {
-            lastDomChangeTime = Date.now();
+            lastDomChangeTime = performance.now();
             stabilityCheckCount = 0; // Reset stability counter on any change
           });
 
@@ -115,7 +156,9 @@ export class ElementUtils {
 
           // Check for page stability
           const checkStability = () => {
-            const timeSinceLastChange = Date.now() - lastDomChangeTime;
+            // Single clock read per check, shared by stability and timeout
+            const now = performance.now();
+            const timeSinceLastChange = now - lastDomChangeTime;
 
             if (timeSinceLastChange >= MIN_STABILITY_DURATION) {
               stabilityCheckCount++;
@@ -123,7 +166,7 @@ export class ElementUtils {
               if (stabilityCheckCount >= STABILITY_THRESHOLD) {
                 observer.disconnect();
                 this.logger.info(
-                  `Navigation complete - page stable for ${timeSinceLastChange}ms`,
+                  `Navigation complete - page stable for ${Math.round(timeSinceLastChange)}ms`,
                   'ElementUtils'
                 );
                 resolve();
@@ -134,7 +177,7 @@ export class ElementUtils {
             }
 
             // Timeout check
-            if (Date.now() - startTime > this.NAVIGATION_TIMEOUT) {
+            if (now - startTime > this.NAVIGATION_TIMEOUT) {
               observer.disconnect();
               this.logger.warn(
                 'Navigation timeout reached, proceeding anyway',
@@ -149,7 +192,7 @@ export class ElementUtils {
 
           // Start stability monitoring after initial delay
           setTimeout(checkStability, TimingConfig.MIN_STABILITY_DURATION);
-        } else if (Date.now() - startTime > this.NAVIGATION_TIMEOUT) {
+        } else if (performance.now() - startTime > this.NAVIGATION_TIMEOUT) {
           this.logger.warn(
             'Document ready timeout reached, proceeding anyway',
             'ElementUtils'
@@ -158,7 +201,7 @@ export class ElementUtils {
         } else {
           setTimeout(
             checkReadyState,
-            AutomationConfig.INTERVALS.READY_STATE_CHECK_INTERVAL
+            AutomationConfig.INTERVALS.READY_STATE_CHECK
           );
         }
       };
@@ -172,12 +215,11 @@ export class ElementUtils {
    */
   async waitForPageStabilization(): Promise<void> {
     return new Promise((resolve) => {
-      let lastChange = Date.now();
-      const stabilizationDelay =
-        AutomationConfig.DELAYS.PAGE_STABILIZATION_DELAY;
+      let lastChange = performance.now();
+      const stabilizationDelay = AutomationConfig.DELAYS.PAGE_STABILIZATION;
 
       const observer = new MutationObserver(() => {
-        lastChange = Date.now();
+        lastChange = performance.now();
       });
 
       observer.observe(document.body, {
@@ -187,7 +229,7 @@ export class ElementUtils {
       });
 
       const checkStability = () => {
-        const timeSinceLastChange = Date.now() - lastChange;
+        const timeSinceLastChange = performance.now() - lastChange;
 
         if (timeSinceLastChange >= stabilizationDelay) {
           observer.disconnect();
@@ -197,10 +239,7 @@ export class ElementUtils {
           );
           resolve();
         } else {
-          setTimeout(
-            checkStability,
-            AutomationConfig.INTERVALS.ELEMENT_CHECK_INTERVAL
-          );
+          setTimeout(checkStability, AutomationConfig.INTERVALS.ELEMENT_CHECK);
         }
       };
 
@@ -212,7 +251,7 @@ export class ElementUtils {
         observer.disconnect();
         this.logger.debug('Page stabilization timeout reached', 'ElementUtils');
         resolve();
-      }, AutomationConfig.TIMEOUTS.PAGE_STABILIZATION_TIMEOUT);
+      }, AutomationConfig.TIMEOUTS.PAGE_STABILIZATION);
     });
   }
 }
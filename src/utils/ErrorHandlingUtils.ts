@@ -1,5 +1,6 @@
 import { LoggingService } from '@/services/LoggingService';
 import { TimingConfig } from '@/config/TimingConfig';
+import { TimestampUtils } from './TimestampUtils';
 
 /**
  * Configuration for error handling operations
@@ -212,7 +213,7 @@ export class ErrorHandlingUtils {
     return {
       operation,
       context,
-      timestamp: new Date().toISOString(),
+      timestamp: TimestampUtils.toISOString(),
       ...additionalData,
     };
   }
@@ -0,0 +1,26 @@
+/**
+ * Utility functions for cheap, repeated timestamp formatting
+ */
+export class TimestampUtils {
+  private static cachedSecond = -1;
+  private static cachedSecondPrefix = '';
+
+  private constructor() {} // Prevent instantiation
+
+  /**
+   * Format epoch milliseconds as an ISO string
+   * The formatted second is reused, only the millisecond tail is rebuilt
+   */
+  static toISOString(timestamp: number = Date.now()): string {
+    const second = Math.floor(timestamp / 1000);
+    if (second !== this.cachedSecond) {
+      this.cachedSecond = second;
+      this.cachedSecondPrefix = new Date(second * 1000)
+        .toISOString()
+        .substring(0, 19);
+    }
+
+    const millis = String(timestamp - second * 1000).padStart(3, '0');
+    return `${this.cachedSecondPrefix}.${millis}Z`;
+  }
+}
@@ -1,5 +1,6 @@
 import { defineConfig } from 'wxt';
 import { config } from 'dotenv';
+import { ExtensionConfig } from './src/config/ExtensionConfig';
 
 // Load environment variables
 config();
@@ -36,7 +37,8 @@ export default defineConfig({
           'fonts/inter-medium.woff2',
           'fonts/inter-semibold.woff2',
         ],
-        matches: ['<all_urls>'],
+        // Only pages the content script runs on load these assets
+        matches: [...ExtensionConfig.CONTENT_SCRIPT_MATCHES],
       },
     ],
   },